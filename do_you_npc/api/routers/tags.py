@@ -1,8 +1,8 @@
 """Tag API routes."""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from do_you_npc.api.dependencies import get_db
@@ -30,9 +30,12 @@ def create_tag(
 
 
 @router.get("/", response_model=List[Tag])
-def list_tags(db: Session = Depends(get_db)):
-    """Get all tags."""
-    tags = TagCRUD.get_all(session=db)
+def list_tags(
+    campaign_id: Optional[int] = Query(None, description="Filter tags by campaign ID"),
+    db: Session = Depends(get_db)
+):
+    """Get all tags, optionally filtered by campaign."""
+    tags = TagCRUD.get_all(session=db, campaign_id=campaign_id)
     return tags
 
 
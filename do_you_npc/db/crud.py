@@ -289,18 +289,26 @@ class TagCRUD:
         return session.execute(stmt).scalar_one_or_none()
     
     @staticmethod
-    def get_all(session: Session) -> List[Tag]:
-        """Get all tags.
-        
+    def get_all(session: Session, campaign_id: int = None) -> List[Tag]:
+        """Get all tags, optionally filtered by campaign.
+
         Args:
             session: Database session
-            
+            campaign_id: Optional campaign ID; when given, only tags used by
+                personas in that campaign are returned
+
         Returns:
-            List[Tag]: List of all tags
+            List[Tag]: List of tags
         """
         stmt = select(Tag)
+        if campaign_id is not None:
+            stmt = (
+                stmt.join(Tag.personas)
+                .where(Persona.campaign_id == campaign_id)
+                .distinct()
+            )
         return list(session.execute(stmt).scalars().all())
-    
+
     @staticmethod
     def update(session: Session, tag_id: int, **kwargs) -> Optional[Tag]:
         """Update a tag.
@@ -5,7 +5,8 @@ import streamlit as st
 from langchain.chains import ConversationalRetrievalChain
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-from do_you_npc.vectorstore import VectorStoreManager, TagRetriever
+from do_you_npc.ui.vectorstore import get_vectorstore_singleton
+from do_you_npc.vectorstore import TagRetriever
 
 
 def setup_retrieval_chain():
@@ -14,8 +15,8 @@ def setup_retrieval_chain():
     Returns:
         ConversationalRetrievalChain: The initialized chain, or None if setup fails
     """
-    manager = VectorStoreManager()
-    vectorstore = manager.get_vectorstore()
+    # Chroma handle is cached per server process, not reopened per rerun
+    vectorstore = get_vectorstore_singleton()
 
     if not vectorstore:
         st.error(
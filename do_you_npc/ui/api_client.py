@@ -134,10 +134,14 @@ class APIClient:
             return None
     
     # Tag endpoints
-    def get_tags(self) -> Optional[List[Dict]]:
-        """Get all tags."""
+    def get_tags(self, campaign_id: Optional[int] = None) -> Optional[List[Dict]]:
+        """Get all tags, optionally filtered by campaign."""
+        params = {}
+        if campaign_id is not None:
+            params["campaign_id"] = campaign_id
+
         try:
-            response = self.session.get(f"{self.base_url}/api/v1/tags/")
+            response = self.session.get(f"{self.base_url}/api/v1/tags/", params=params)
             return self._handle_response(response)
         except requests.RequestException as e:
             st.error(f"Failed to connect to API: {e}")
@@ -0,0 +1,21 @@
+"""Cached vector store access for the Streamlit UI."""
+
+from typing import TYPE_CHECKING, Optional
+
+import streamlit as st
+
+from do_you_npc.vectorstore import VectorStoreManager
+
+if TYPE_CHECKING:
+    from langchain_chroma import Chroma
+
+
+@st.cache_resource
+def get_vectorstore_singleton() -> Optional["Chroma"]:
+    """Get one cached Chroma handle shared across Streamlit reruns.
+
+    Opening Chroma and building the embeddings client is expensive
+    (SQLite open + gRPC channel setup), so the handle is created once
+    per server process instead of on every script rerun.
+    """
+    return VectorStoreManager().get_vectorstore()
@@ -10,7 +10,25 @@ load_dotenv()
 
 # Database setup
 DATABASE_URL = f"""postgresql://{os.getenv('POSTGRES_USER')}:{os.getenv('POSTGRES_PASSWORD')}@{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}/{os.getenv('POSTGRES_DB')}"""  # noqa: E501
-engine = create_engine(DATABASE_URL)
+
+# Optional server-side statement timeout in milliseconds; unset means no
+# timeout, so long-running bulk updates and maintenance scripts are not
+# aborted by default
+_statement_timeout = os.getenv('POSTGRES_STATEMENT_TIMEOUT_MS')
+_connect_args = (
+    {"options": f"-c statement_timeout={int(_statement_timeout)}"}
+    if _statement_timeout else {}
+)
+
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,  # drop stale connections instead of erroring mid-request
+    pool_recycle=1800,
+    pool_use_lifo=True,  # prefer the most recently used (warm) connection
+    connect_args=_connect_args,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
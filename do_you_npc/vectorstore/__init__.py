@@ -1,7 +1,20 @@
 """Vector store management for Do You NPC."""
 
-from .manager import VectorStoreManager
-from .loader import TextFileLoader
-from .retriever import TagRetriever
+__all__ = ["VectorStoreManager", "TextFileLoader", "TagRetriever"]
 
-__all__ = ["VectorStoreManager", "TextFileLoader", "TagRetriever"]
\ No newline at end of file
+# Lazy re-exports (PEP 562): the submodules pull in langchain/Chroma/gRPC,
+# which costs hundreds of ms of import time. Importing this package stays
+# cheap until one of the classes is actually used.
+_SUBMODULES = {
+    "VectorStoreManager": "manager",
+    "TextFileLoader": "loader",
+    "TagRetriever": "retriever",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        from importlib import import_module
+        module = import_module(f".{_SUBMODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,48 @@
 """Text file loading and processing for vector store."""
 
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any
 
 from langchain.schema import Document
 
+# Path-layout markers used when classifying files in _extract_metadata
+_CAMPAIGNS_PART = 'campaigns'
+_GLOBAL_PART = 'global'
+
+
+def _tag_signature(tag_name: str) -> int:
+    """Compute a deterministic 63-bit signature for a tag name.
+
+    Sets four hash-derived bits in a 63-bit word, Bloom-filter style. A
+    document's OR-ed signature lets retrieval prune candidates that
+    cannot match any queried tag with a single bitwise AND. Derived from
+    a stable hash so no signature table needs to be persisted. Bit 63
+    is never set: the value must stay within SQLite's signed 64-bit
+    integer range, since Chroma persists int metadata through sqlite3.
+    """
+    digest = hashlib.blake2b(tag_name.encode('utf-8'), digest_size=4).digest()
+    signature = 0
+    for byte in digest:
+        signature |= 1 << (byte % 63)
+    return signature
+
+
+def _iter_txt_entries(dirpath):
+    """Yield os.DirEntry objects for every .txt file under a directory.
+
+    scandir keeps the stat information from the directory listing on the
+    entry, so callers can read file size/mtime without extra syscalls.
+    """
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_txt_entries(entry.path)
+            elif entry.name.endswith('.txt'):
+                yield entry
+
 
 class TextFileLoader:
     """Loads and processes text files from the data source directory."""
@@ -17,33 +54,71 @@ class TextFileLoader:
             source_dir: Path to the directory containing text files
         """
         self.source_dir = Path(source_dir)
-    
-    def _extract_metadata(self, file_path: Path) -> Dict[str, Any]:
+        # Precomputed so _extract_metadata can slice file_path.parts
+        # directly instead of calling relative_to() per file
+        self._source_parts_len = len(self.source_dir.parts)
+
+    def _load_documents_parallel(self, files: List) -> List[Document]:
+        """Load multiple text files concurrently.
+
+        File reads are IO-latency-bound, so a bounded thread pool overlaps
+        them. One unreadable file is reported and skipped rather than
+        failing the whole batch.
+
+        Args:
+            files: Paths of the text files to load, either as Path objects
+                or as (Path, stat_result) pairs when the caller already
+                has stat information
+
+        Returns:
+            List of Document objects for the files that loaded successfully
+        """
+        if not files:
+            return []
+
+        documents = []
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            futures = {}
+            for item in files:
+                path, stat_result = item if isinstance(item, tuple) else (item, None)
+                futures[executor.submit(self.load_document, path, stat_result)] = path
+            for future in as_completed(futures):
+                try:
+                    documents.append(future.result())
+                except Exception as e:
+                    print(f"Error loading {futures[future]}: {e}")
+                    continue
+
+        return documents
+
+    def _extract_metadata(self, file_path: Path, stat_result: os.stat_result = None) -> Dict[str, Any]:
         """Extract metadata from file path structure.
-        
+
         Args:
             file_path: Path to the text file
-            
+            stat_result: Optional pre-fetched stat result, avoiding an
+                extra stat() call when the caller already has one
+
         Returns:
             Dictionary containing metadata about the file
         """
-        # Get relative path from source directory
-        rel_path = file_path.relative_to(self.source_dir)
-        parts = rel_path.parts
-        
+        # Slice off the source-directory prefix instead of walking
+        # parents with relative_to()
+        parts = file_path.parts[self._source_parts_len:]
+
         metadata = {
             'source': str(file_path),
             'filename': file_path.name,
             'file_stem': file_path.stem,  # filename without extension
         }
-        
+
         # Determine if it's a campaign-specific or global tag
-        if parts[0] == 'campaigns' and len(parts) >= 4:
+        if parts[0] == _CAMPAIGNS_PART and len(parts) >= 4:
             # campaigns/[campaign_name]/tags/[tag_name].txt
             metadata['type'] = 'campaign_tag'
             metadata['campaign'] = parts[1]
             metadata['tag_name'] = file_path.stem
-        elif parts[0] == 'global' and len(parts) >= 3:
+        elif parts[0] == _GLOBAL_PART and len(parts) >= 3:
             # global/tags/[tag_name].txt
             metadata['type'] = 'global_tag'
             metadata['campaign'] = None
@@ -53,28 +128,31 @@ class TextFileLoader:
             metadata['type'] = 'other'
             metadata['campaign'] = None
             metadata['tag_name'] = file_path.stem
-        
+
+        # Bitmask signature for cheap multi-tag candidate pruning
+        metadata['tag_bits'] = _tag_signature(metadata['tag_name'])
+
         # Add file size and modification time
-        stat = file_path.stat()
+        stat = stat_result if stat_result is not None else file_path.stat()
         metadata['file_size'] = stat.st_size
         metadata['modified'] = stat.st_mtime
-        
+
         return metadata
     
-    def load_document(self, file_path: Path) -> Document:
+    def load_document(self, file_path: Path, stat_result: os.stat_result = None) -> Document:
         """Load a single text file as a Document.
-        
+
         Args:
             file_path: Path to the text file
-            
+            stat_result: Optional pre-fetched stat result for the file
+
         Returns:
             Document object with content and metadata
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        metadata = self._extract_metadata(file_path)
-        
+        content = file_path.read_text(encoding='utf-8')
+
+        metadata = self._extract_metadata(file_path, stat_result)
+
         return Document(
             page_content=content,
             metadata=metadata
@@ -110,9 +188,8 @@ class TextFileLoader:
         # Look for directory with multiple files: tag_name/
         multi_dir = tag_dir / tag_name
         if multi_dir.exists() and multi_dir.is_dir():
-            for txt_file in multi_dir.glob("*.txt"):
-                documents.append(self.load_document(txt_file))
-        
+            documents.extend(self._load_documents_parallel(list(multi_dir.glob("*.txt"))))
+
         return documents
     
     def load_campaign_documents(self, campaign: str) -> List[Document]:
@@ -124,17 +201,13 @@ class TextFileLoader:
         Returns:
             List of Document objects for the campaign
         """
-        documents = []
         campaign_dir = self.source_dir / "campaigns" / campaign / "tags"
-        
+
         if not campaign_dir.exists():
-            return documents
-        
+            return []
+
         # Load all .txt files in the campaign tags directory
-        for txt_file in campaign_dir.rglob("*.txt"):
-            documents.append(self.load_document(txt_file))
-        
-        return documents
+        return self._load_documents_parallel(list(campaign_dir.rglob("*.txt")))
     
     def load_all_documents(self) -> List[Document]:
         """Load all text documents from the source directory.
@@ -142,17 +215,11 @@ class TextFileLoader:
         Returns:
             List of all Document objects found
         """
-        documents = []
-        
-        # Load all .txt files recursively
-        for txt_file in self.source_dir.rglob("*.txt"):
-            try:
-                documents.append(self.load_document(txt_file))
-            except Exception as e:
-                print(f"Error loading {txt_file}: {e}")
-                continue
-        
-        return documents
+        # Walk with scandir so each entry's cached stat rides along into
+        # _extract_metadata, avoiding one stat syscall per file
+        files = [(Path(entry.path), entry.stat())
+                 for entry in _iter_txt_entries(self.source_dir)]
+        return self._load_documents_parallel(files)
     
     def get_available_tags(self, campaign: str = None) -> List[str]:
         """Get list of available tag names.
@@ -172,17 +239,19 @@ class TextFileLoader:
         
         if not tag_dir.exists():
             return []
-        
-        # Find single files
-        for txt_file in tag_dir.glob("*.txt"):
-            tags.add(txt_file.stem)
-        
-        # Find directories
-        for item in tag_dir.iterdir():
-            if item.is_dir() and any(item.glob("*.txt")):
-                tags.add(item.name)
-        
-        return sorted(list(tags))
+
+        # One scandir pass picks up both single-file tags and tag
+        # directories, instead of walking the directory twice
+        with os.scandir(tag_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.txt'):
+                    tags.add(entry.name[:-4])
+                elif entry.is_dir():
+                    with os.scandir(entry.path) as sub_entries:
+                        if any(sub.name.endswith('.txt') for sub in sub_entries):
+                            tags.add(entry.name)
+
+        return sorted(tags)
     
     def get_available_campaigns(self) -> List[str]:
         """Get list of available campaign names.
@@ -1,18 +1,42 @@
 """Vector store management for tag content."""
 
-import json
+import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_chroma import Chroma
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
+import orjson
 
 from do_you_npc.vectorstore.loader import TextFileLoader
 
+if TYPE_CHECKING:
+    from langchain_chroma import Chroma
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+logger = logging.getLogger(__name__)
+
+# Shared embeddings client so every caller reuses one gRPC channel
+_embeddings = None
+
+
+def get_embeddings() -> "GoogleGenerativeAIEmbeddings":
+    """Get the shared embeddings client, creating it on first use."""
+    global _embeddings
+    if _embeddings is None:
+        # Imported lazily: pulls in gRPC + protobuf, which callers that
+        # never touch embeddings should not pay for
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+        _embeddings = GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
+    return _embeddings
+
 
 class VectorStoreManager:
     """Manages vector store creation and updates for tag content."""
@@ -36,121 +60,257 @@ class VectorStoreManager:
         # Ensure directories exist
         for directory in [self.data_dir, self.source_dir, self.vectorstore_dir, self.processed_dir]:
             directory.mkdir(parents=True, exist_ok=True)
+
+        # In-process cache of last_updated.json; needs_update() runs on
+        # every get_vectorstore() call so repeated reads should hit memory
+        self._metadata_cache = None
     
     def clean_vectorstore(self) -> None:
         """Remove existing vectorstore if it exists."""
         if self.vectorstore_dir.exists():
-            print(f"Removing existing vector store at: {self.vectorstore_dir}")
+            logger.info("Removing existing vector store at: %s", self.vectorstore_dir)
             shutil.rmtree(self.vectorstore_dir)
             self.vectorstore_dir.mkdir(parents=True, exist_ok=True)
     
-    def get_last_updated(self) -> Optional[datetime]:
-        """Get the timestamp of the last vector store update."""
+    def _read_metadata(self) -> Optional[dict]:
+        """Read the update-tracking metadata file, or None if unusable."""
+        if self._metadata_cache is not None:
+            return self._metadata_cache
+
         metadata_file = self.processed_dir / "last_updated.json"
         if not metadata_file.exists():
             return None
-        
+
         try:
-            with open(metadata_file, 'r') as f:
-                data = json.load(f)
-                return datetime.fromisoformat(data['last_updated'])
-        except (json.JSONDecodeError, KeyError, ValueError):
+            self._metadata_cache = orjson.loads(metadata_file.read_bytes())
+        except orjson.JSONDecodeError:
             return None
-    
+        return self._metadata_cache
+
+    def get_last_updated(self) -> Optional[datetime]:
+        """Get the timestamp of the last vector store update."""
+        data = self._read_metadata()
+        if data is None:
+            return None
+
+        try:
+            return datetime.fromisoformat(data['last_updated'])
+        except (KeyError, ValueError):
+            return None
+
+    def get_file_manifest(self) -> dict:
+        """Get the per-file mtime manifest from the last update."""
+        data = self._read_metadata()
+        if data is None:
+            return {}
+        return data.get('files', {})
+
     def update_last_updated(self) -> None:
-        """Update the last updated timestamp."""
+        """Update the last updated timestamp and per-file manifest."""
         metadata_file = self.processed_dir / "last_updated.json"
+        files = self._source_mtimes()
         data = {
             'last_updated': datetime.now().isoformat(),
-            'version': '1.0'
+            'max_mtime': max(files.values(), default=0.0),
+            'files': files,
+            'version': '1.1'
         }
-        with open(metadata_file, 'w') as f:
-            json.dump(data, f, indent=2)
-    
+        metadata_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        self._metadata_cache = data
+
+    def _source_mtimes(self) -> dict:
+        """Map each source text file path to its modification time."""
+        mtimes = {}
+        stack = [str(self.source_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.txt'):
+                        mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime
+        return mtimes
+
     def needs_update(self) -> bool:
         """Check if vector store needs to be updated based on file timestamps."""
         last_updated = self.get_last_updated()
         if last_updated is None:
             return True
-        
-        # Check if any source files are newer than the last update
-        for txt_file in self.source_dir.rglob("*.txt"):
-            if datetime.fromtimestamp(txt_file.stat().st_mtime) > last_updated:
-                return True
-        
+
+        # Compare raw mtime floats against a threshold computed once and
+        # walk with scandir so each entry's stat info comes for free
+        threshold = last_updated.timestamp()
+        stack = [str(self.source_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.txt'):
+                        if entry.stat(follow_symlinks=False).st_mtime > threshold:
+                            return True
+
         return False
     
-    def create_vectorstore(self, clean_start: bool = False, chunk_size: int = 1000, chunk_overlap: int = 200) -> Optional[Chroma]:
+    def create_vectorstore(self, clean_start: bool = False, chunk_size: int = 1500, chunk_overlap: int = 150) -> Optional["Chroma"]:
         """Create or update the vector store with tag content.
-        
+
         Args:
             clean_start: Whether to start fresh by removing existing vectorstore
-            chunk_size: Size of text chunks for embeddings
-            chunk_overlap: Overlap between text chunks
-            
+            chunk_size: Size of text chunks for embeddings, in tokens
+            chunk_overlap: Overlap between text chunks, in tokens
+
         Returns:
             The created Chroma vectorstore or None if no documents found
         """
         if clean_start:
             self.clean_vectorstore()
-        
-        print(f"Loading documents from: {self.source_dir}")
-        
-        # Load all text files using our custom loader
-        loader = TextFileLoader(self.source_dir)
-        documents = loader.load_all_documents()
-        
-        if not documents:
-            print("No text files found in the source directory!")
+
+        logger.info("Loading documents from: %s", self.source_dir)
+
+        current_files = self._source_mtimes()
+        if not current_files:
+            logger.warning("No text files found in the source directory!")
             return None
-        
-        print(f"Loaded {len(documents)} documents")
-        
-        # Split documents into chunks
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""],
+
+        # Diff against the per-file manifest from the last update so only
+        # files that actually changed are re-embedded. A clean start
+        # re-embeds everything, and so does a missing or wiped store:
+        # the manifest lives in processed/, so it can outlive the Chroma
+        # data and must not make an empty store look up to date
+        store_present = self.vectorstore_dir.exists() and any(self.vectorstore_dir.iterdir())
+        manifest = {} if clean_start or not store_present else self.get_file_manifest()
+        changed = [path for path, mtime in current_files.items()
+                   if manifest.get(path) != mtime]
+        removed = [path for path in manifest if path not in current_files]
+
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        from langchain_chroma import Chroma
+
+        embeddings = get_embeddings()
+        vectorstore = Chroma(
+            persist_directory=str(self.vectorstore_dir),
+            embedding_function=embeddings
         )
-        splits = text_splitter.split_documents(documents)
-        print(f"Created {len(splits)} text chunks")
-        
-        # Create and persist the vectorstore
-        print("Creating embeddings and vector store...")
-        embeddings = GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
-        
-        if self.vectorstore_dir.exists() and any(self.vectorstore_dir.iterdir()):
-            # Load existing vectorstore and add new documents
-            vectorstore = Chroma(
-                persist_directory=str(self.vectorstore_dir),
-                embedding_function=embeddings
-            )
-            vectorstore.add_documents(splits)
-        else:
-            # Create new vectorstore
-            vectorstore = Chroma.from_documents(
-                documents=splits,
-                embedding=embeddings,
-                persist_directory=str(self.vectorstore_dir)
+
+        if not changed and not removed:
+            logger.info("Vector store is already up to date")
+            return vectorstore
+
+        # Drop stale chunks for changed or deleted files before re-adding
+        if manifest and (changed or removed):
+            vectorstore.delete(where={"source": {"$in": changed + removed}})
+
+        if changed:
+            loader = TextFileLoader(self.source_dir)
+            documents = loader._load_documents_parallel([Path(p) for p in changed])
+            logger.info("Loaded %d changed documents", len(documents))
+
+            # Split documents into chunks, sized by token count rather
+            # than characters: ~4 chars/token means character-based 1000
+            # chunks were only ~250 tokens, far below what the embedding
+            # model accepts, so this cuts the chunk count (and embedding
+            # calls) roughly 3x
+            text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                encoding_name="cl100k_base",
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                separators=["\n\n", "\n", " ", ""],
             )
-        
+            splits = text_splitter.split_documents(documents)
+            # Stored per chunk so retrieval-side statistics can sum plain
+            # ints from metadata instead of re-measuring document text
+            for split in splits:
+                split.metadata['content_length'] = len(split.page_content)
+            logger.info("Created %d text chunks", len(splits))
+
+            logger.info("Creating embeddings and vector store...")
+            self._add_documents_batched(vectorstore, splits)
+
         self.update_last_updated()
-        print(f"Vector store created/updated and saved to: {self.vectorstore_dir}")
+        self.build_tag_index(vectorstore)
+        logger.info("Vector store created/updated and saved to: %s", self.vectorstore_dir)
         return vectorstore
+
+    def build_tag_index(self, vectorstore: "Chroma") -> None:
+        """Build the tag-to-document-id sidecar index for fast lookups.
+
+        Writes tag_index.npz next to the Chroma data: sorted tag names,
+        int32 offsets, and the concatenated document ids per tag, CSR
+        style. Retrieval can then resolve a tag to its document ids with
+        a binary search plus an array slice instead of asking Chroma to
+        evaluate a metadata filter over the whole collection.
+
+        Args:
+            vectorstore: The Chroma vectorstore to index
+        """
+        import numpy as np
+
+        result = vectorstore._collection.get(include=['metadatas'])
+        ids_by_tag = {}
+        for doc_id, metadata in zip(result['ids'], result['metadatas']):
+            tag_name = (metadata or {}).get('tag_name')
+            if tag_name:
+                ids_by_tag.setdefault(tag_name, []).append(doc_id)
+
+        tag_names = sorted(ids_by_tag)
+        offsets = np.zeros(len(tag_names) + 1, dtype=np.int32)
+        doc_ids = []
+        for i, tag_name in enumerate(tag_names):
+            doc_ids.extend(ids_by_tag[tag_name])
+            offsets[i + 1] = len(doc_ids)
+
+        np.savez(
+            self.vectorstore_dir / "tag_index.npz",
+            # Chroma document ids are UUID strings, so both arrays are
+            # fixed-width numpy string arrays
+            tag_names=np.array(tag_names, dtype=np.str_),
+            offsets=offsets,
+            doc_ids=np.array(doc_ids, dtype=np.str_),
+        )
+        logger.info("Tag index written for %d tags", len(tag_names))
     
-    def get_vectorstore(self) -> Optional[Chroma]:
+    def _add_documents_batched(self, vectorstore: "Chroma", splits: List,
+                               batch_size: int = 100, max_workers: int = 4) -> None:
+        """Add document chunks to the vectorstore in concurrent batches.
+
+        Args:
+            vectorstore: Target Chroma vectorstore
+            splits: Document chunks to embed and store
+            batch_size: Number of chunks per embedding request
+            max_workers: Number of concurrent embedding requests
+        """
+        if not splits:
+            return
+
+        batches = [splits[i:i + batch_size] for i in range(0, len(splits), batch_size)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(vectorstore.add_documents, batch)
+                       for batch in batches]
+            if tqdm is not None:
+                # tqdm throttles its own refresh rate, so progress output
+                # never blocks the embedding threads on terminal IO
+                for future in tqdm(futures, desc="embedding"):
+                    future.result()
+            else:
+                for i, future in enumerate(futures, start=1):
+                    future.result()
+                    logger.info("Embedded batch %d/%d", i, len(batches))
+
+    def get_vectorstore(self) -> Optional["Chroma"]:
         """Get the existing vectorstore, creating it if necessary."""
         if not self.vectorstore_dir.exists() or not any(self.vectorstore_dir.iterdir()):
-            print("Vector store not found, creating...")
+            logger.info("Vector store not found, creating...")
             return self.create_vectorstore()
-        
+
         if self.needs_update():
-            print("Vector store is outdated, updating...")
+            logger.info("Vector store is outdated, updating...")
             return self.create_vectorstore(clean_start=False)
-        
+
         # Load existing vectorstore
-        embeddings = GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
+        from langchain_chroma import Chroma
+
+        embeddings = get_embeddings()
         return Chroma(
             persist_directory=str(self.vectorstore_dir),
             embedding_function=embeddings
@@ -0,0 +1,74 @@
+"""Thread-safe LRU + TTL cache for vector store query results."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class QueryCache:
+    """Caches retrieval results so repeated queries skip the vector store.
+
+    NPC turn-by-turn chats reuse the same tag queries constantly, so a
+    small in-memory cache converts the hot path from an embedding
+    round-trip plus index traversal into a dict lookup. Entries are
+    evicted least-recently-used on overflow and expire after a TTL so
+    vector store updates eventually become visible.
+    """
+
+    def __init__(self, max_size: int = 2000, ttl: float = 300.0):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached queries before LRU eviction
+            ttl: Seconds before a cached result expires
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached result, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used on overflow."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters and the current size."""
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._entries),
+            }
@@ -1,36 +1,186 @@
 """Query and retrieval functions for tag content."""
 
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 
+import numpy as np
 from langchain.schema import Document
 from langchain_chroma import Chroma
 
-from do_you_npc.vectorstore.manager import VectorStoreManager
+from do_you_npc.vectorstore.loader import _tag_signature
+from do_you_npc.vectorstore.manager import VectorStoreManager, get_embeddings
+from do_you_npc.vectorstore.query_cache import QueryCache
+
+
+# Cached tag embeddings. Tag names form a small closed vocabulary, so
+# each costs at most one Gemini round-trip per process; a plain dict
+# (rather than lru_cache) lets the batch path check for misses without
+# triggering per-tag embedding calls.
+_TAG_VECTORS: Dict[str, List[float]] = {}
+
+
+def _embed_tag(tag_name: str) -> List[float]:
+    """Embed a tag name, caching the vector."""
+    vector = _TAG_VECTORS.get(tag_name)
+    if vector is None:
+        vector = get_embeddings().embed_query(tag_name)
+        _TAG_VECTORS[tag_name] = vector
+    return vector
+
+
+def _embed_tags(tag_names: List[str]) -> List[List[float]]:
+    """Embed several tag names, batch-embedding only the cache misses.
+
+    After the first turn a persona's tags are all cached, so repeat
+    turns make no embedding calls at all. Misses are embedded with the
+    retrieval-query task type: these vectors query the index, and the
+    cache is shared with _embed_tag's embed_query results, so both paths
+    must produce identical vectors for the same tag.
+    """
+    misses = [name for name in dict.fromkeys(tag_names) if name not in _TAG_VECTORS]
+    if misses:
+        vectors = get_embeddings().embed_documents(misses, task_type="RETRIEVAL_QUERY")
+        _TAG_VECTORS.update(zip(misses, vectors))
+    return [_TAG_VECTORS[name] for name in tag_names]
+
+
+def _mmr_select_kernel(sims_to_q: np.ndarray, embeddings: np.ndarray, k: int,
+                       lambda_mult: float) -> np.ndarray:
+    """Select k candidate indices by maximal marginal relevance.
+
+    Operates on L2-normalized embeddings, so candidate-candidate
+    similarities are plain dot products. Written with explicit loops and
+    preallocated arrays (no fancy indexing) so numba can compile it
+    unchanged; without numba it runs as-is.
+
+    Args:
+        sims_to_q: Cosine similarity of each candidate to the query
+        embeddings: Contiguous L2-normalized candidate embedding matrix
+        k: Number of candidates to select
+        lambda_mult: Relevance/diversity trade-off in [0, 1]
+
+    Returns:
+        Array of selected candidate indices, in selection order
+    """
+    n = sims_to_q.shape[0]
+    dim = embeddings.shape[1]
+    selected = np.empty(k, dtype=np.int64)
+    chosen = np.zeros(n, dtype=np.bool_)
+    max_sim_to_selected = np.zeros(n, dtype=np.float32)
+
+    # Seed with the most query-similar candidate
+    best = 0
+    for i in range(1, n):
+        if sims_to_q[i] > sims_to_q[best]:
+            best = i
+    selected[0] = best
+    chosen[best] = True
+
+    for step in range(1, k):
+        last = selected[step - 1]
+        next_idx = 0
+        next_score = -np.inf
+        for i in range(n):
+            if chosen[i]:
+                continue
+            sim = np.float32(0.0)
+            for j in range(dim):
+                sim += embeddings[i, j] * embeddings[last, j]
+            if sim > max_sim_to_selected[i]:
+                max_sim_to_selected[i] = sim
+            score = lambda_mult * sims_to_q[i] - (1.0 - lambda_mult) * max_sim_to_selected[i]
+            if score > next_score:
+                next_score = score
+                next_idx = i
+        selected[step] = next_idx
+        chosen[next_idx] = True
+
+    return selected
+
+
+# Resolved on first use: numba-compiled kernel when numba is installed,
+# otherwise the plain-Python kernel above
+_mmr_select = None
+
+
+def _resolve_mmr_select():
+    """Get the MMR kernel, JIT-compiling it on first use if numba exists.
+
+    numba's import alone costs over a second, so it is deferred until the
+    first MMR search rather than paid at module import.
+    """
+    global _mmr_select
+    if _mmr_select is None:
+        try:
+            import numba
+            _mmr_select = numba.njit(cache=True, fastmath=True)(_mmr_select_kernel)
+        except ImportError:
+            _mmr_select = _mmr_select_kernel
+    return _mmr_select
+
+
+def _truncate(content: str, max_length: int = 300, _suffix: str = '...') -> str:
+    """Truncate content to a reasonable length for LLM context."""
+    return content if len(content) <= max_length else content[:max_length] + _suffix
+
+
+# Filter constructors prebuilt per (has_tag_name, has_campaign) shape, so
+# hot search paths dispatch to one pre-shaped builder instead of
+# branching and assembling dict keys on every call
+_FILTER_BUILDERS = {
+    (False, False): lambda tag_name, campaign: None,
+    (True, False): lambda tag_name, campaign: {'tag_name': tag_name},
+    (False, True): lambda tag_name, campaign: {'campaign': campaign},
+    (True, True): lambda tag_name, campaign: {'tag_name': tag_name,
+                                              'campaign': campaign},
+}
+
+
+def _build_filter(tag_name: str = None, campaign: str = None) -> Optional[Dict[str, str]]:
+    """Build a metadata filter dict, or None when nothing is filtered."""
+    builder = _FILTER_BUILDERS[(tag_name is not None, campaign is not None)]
+    return builder(tag_name, campaign)
 
 
 class TagRetriever:
     """Handles queries and retrieval of tag content from vector store."""
-    
+
     def __init__(self, project_root: Optional[str] = None):
         """Initialize the retriever.
-        
+
         Args:
             project_root: Path to project root. If None, auto-detected.
         """
         self.manager = VectorStoreManager(project_root)
         self._vectorstore = None
+        self._cache = QueryCache(max_size=2000, ttl=300)
+        # Tag sidecar index: None = not loaded yet, False = unavailable
+        self._tag_index = None
+        # Start opening the vector store immediately so the Chroma open +
+        # index load overlaps with whatever the caller does next; the
+        # vectorstore property joins on the future at first access
+        self._vs_executor = ThreadPoolExecutor(max_workers=1)
+        self._vs_future = self._vs_executor.submit(self.manager.get_vectorstore)
     
     @property
     def vectorstore(self) -> Optional[Chroma]:
-        """Get the vector store, loading it if necessary."""
-        if self._vectorstore is None:
-            self._vectorstore = self.manager.get_vectorstore()
+        """Get the vector store, joining the background load if necessary."""
+        if self._vectorstore is None and self._vs_future is not None:
+            self._vectorstore = self._vs_future.result()
+            self._vs_future = None
         return self._vectorstore
-    
+
     def refresh_vectorstore(self) -> None:
         """Force refresh of the vector store."""
         self._vectorstore = None
-        self._vectorstore = self.manager.get_vectorstore()
+        self._tag_index = None
+        self._cache.clear()
+        self._vs_future = self._vs_executor.submit(self.manager.get_vectorstore)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters for the query cache."""
+        return self._cache.stats()
     
     def search_tags(self, query: str, k: int = 5, campaign: str = None) -> List[Document]:
         """Search for relevant tag content based on a query.
@@ -45,39 +195,268 @@ class TagRetriever:
         """
         if not self.vectorstore:
             return []
-        
+
+        cache_key = ('search_tags', query, k, campaign)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Build search filter if campaign is specified
         search_kwargs = {"k": k}
-        if campaign:
-            search_kwargs["filter"] = {"campaign": campaign}
-        
-        return self.vectorstore.similarity_search(query, **search_kwargs)
+        filter_dict = _build_filter(campaign=campaign or None)
+        if filter_dict:
+            search_kwargs["filter"] = filter_dict
+
+        results = self.vectorstore.similarity_search(query, **search_kwargs)
+        self._cache.put(cache_key, results)
+        return results
     
-    def search_by_tag_name(self, tag_name: str, campaign: str = None, k: int = 10) -> List[Document]:
+    def search_by_tag_name(self, tag_name: str, campaign: str = None, k: int = 10,
+                           semantic: bool = False) -> List[Document]:
         """Search for content from a specific tag.
-        
+
+        The tag filter is exact, so by default this is a pure metadata
+        lookup that never embeds the tag name or walks the vector index.
+        Pass semantic=True to rank results by similarity to the tag name
+        instead.
+
         Args:
             tag_name: Name of the tag to search for
             campaign: Optional campaign filter
             k: Number of results to return
-            
+            semantic: Whether to rank results by similarity to the tag name
+
         Returns:
             List of Document objects from the specified tag
         """
         if not self.vectorstore:
             return []
-        
+
+        cache_key = ('search_by_tag_name', tag_name, campaign, k, semantic)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Build filter for tag name and optionally campaign
-        filter_dict = {"tag_name": tag_name}
-        if campaign:
-            filter_dict["campaign"] = campaign
-        
-        return self.vectorstore.similarity_search(
-            tag_name,  # Use tag name as query
-            k=k,
-            filter=filter_dict
+        filter_dict = _build_filter(tag_name, campaign or None)
+
+        if semantic:
+            # The tag name is the query, so reuse its cached embedding
+            # instead of re-embedding the same string every call
+            results = self.vectorstore.similarity_search_by_vector(
+                _embed_tag(tag_name),
+                k=k,
+                filter=filter_dict
+            )
+        else:
+            # The sidecar index resolves a tag straight to document ids;
+            # it is unfiltered by campaign, so only use it when no
+            # campaign filter applies
+            results = None if campaign else self._search_tag_index(tag_name, k)
+            if results is None:
+                result = self.vectorstore._collection.get(
+                    where=filter_dict,
+                    limit=k,
+                    include=['documents', 'metadatas']
+                )
+                results = [Document(page_content=doc, metadata=meta or {})
+                           for doc, meta in zip(result['documents'], result['metadatas'])]
+
+        self._cache.put(cache_key, results)
+        return results
+
+    def _load_tag_index(self):
+        """Get the sidecar index arrays, loading the file on first use.
+
+        Returns:
+            (tag_names, offsets, doc_ids) arrays, or None when the
+            sidecar has not been built
+        """
+        if self._tag_index is None:
+            index_path = self.manager.vectorstore_dir / "tag_index.npz"
+            if index_path.exists():
+                data = np.load(index_path, mmap_mode='r')
+                self._tag_index = (data['tag_names'], data['offsets'], data['doc_ids'])
+            else:
+                self._tag_index = False
+        return self._tag_index or None
+
+    def _search_tag_index(self, tag_name: str, k: int) -> Optional[List[Document]]:
+        """Resolve a tag's documents through the sidecar index.
+
+        A binary search over the sorted tag names plus one array slice
+        yields the document ids directly, so Chroma only fetches by id —
+        no metadata filter evaluation at all.
+
+        Args:
+            tag_name: Name of the tag to look up
+            k: Maximum number of documents to fetch
+
+        Returns:
+            List of Document objects, or None when the sidecar is missing
+            or does not know the tag (callers fall back to the filtered
+            path, since absence may just mean the index is stale)
+        """
+        index = self._load_tag_index()
+        if index is None:
+            return None
+
+        tag_names, offsets, doc_ids = index
+        i = int(np.searchsorted(tag_names, tag_name))
+        if i >= len(tag_names) or tag_names[i] != tag_name:
+            return None
+
+        ids = [str(doc_id) for doc_id in doc_ids[offsets[i]:offsets[i + 1]][:k]]
+        result = self.vectorstore._collection.get(
+            ids=ids,
+            include=['documents', 'metadatas']
         )
+        return [Document(page_content=doc, metadata=meta or {})
+                for doc, meta in zip(result['documents'], result['metadatas'])]
     
+    def batch_search_by_tag_names(self, tag_names: List[str], campaign: str = None,
+                                  k_per_tag: int = 2) -> List[Tuple[str, Document]]:
+        """Search several tags with one embedding call and parallel lookups.
+
+        Uncached tag names are embedded in a single embed_documents
+        request (cached ones cost nothing), then the filtered vector
+        searches run concurrently, so the fixed per-call overhead is
+        paid at most once per batch instead of once per tag.
+
+        Args:
+            tag_names: Names of the tags to search for
+            campaign: Optional campaign filter
+            k_per_tag: Number of results to return per tag
+
+        Returns:
+            List of (tag_name, Document) tuples in tag order
+        """
+        if not self.vectorstore or not tag_names:
+            return []
+
+        vectors = _embed_tags(list(tag_names))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = []
+            for tag_name, vector in zip(tag_names, vectors):
+                filter_dict = _build_filter(tag_name, campaign or None)
+                futures.append((tag_name, executor.submit(
+                    self.vectorstore.similarity_search_by_vector,
+                    vector, k=k_per_tag, filter=filter_dict
+                )))
+
+            return [(tag_name, doc)
+                    for tag_name, future in futures
+                    for doc in future.result()]
+
+    def search_tags_mmr(self, query: str, k: int = 5, fetch_k: int = None,
+                        lambda_mult: float = 0.5, campaign: str = None) -> List[Document]:
+        """Search with maximal marginal relevance reranking.
+
+        Plain similarity search tends to spend the k budget on
+        near-duplicate chunks. This fetches a larger candidate pool with
+        embeddings in a single collection query, then picks k diverse
+        results with a numpy-vectorized MMR loop — no embedding calls
+        beyond the initial query embedding.
+
+        Args:
+            query: Search query string
+            k: Number of results to return
+            fetch_k: Candidate pool size; defaults to 4 * k
+            lambda_mult: Relevance/diversity trade-off in [0, 1]
+            campaign: Optional campaign filter
+
+        Returns:
+            List of relevant, mutually diverse Document objects
+        """
+        if not self.vectorstore:
+            return []
+        if fetch_k is None:
+            fetch_k = 4 * k
+
+        query_vector = get_embeddings().embed_query(query)
+        result = self.vectorstore._collection.query(
+            query_embeddings=[query_vector],
+            n_results=fetch_k,
+            where=_build_filter(campaign=campaign or None),
+            include=['documents', 'metadatas', 'embeddings'],
+        )
+
+        documents = result['documents'][0]
+        if not documents:
+            return []
+        metadatas = result['metadatas'][0]
+
+        # Normalize once so every similarity below is a dot product
+        embeddings = np.asarray(result['embeddings'][0], dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings /= norms
+
+        query_vec = np.asarray(query_vector, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vec)
+        if query_norm:
+            query_vec /= query_norm
+        sims_to_q = embeddings @ query_vec
+
+        embeddings = np.ascontiguousarray(embeddings)
+        selected = _resolve_mmr_select()(sims_to_q, embeddings,
+                                         min(k, len(documents)), lambda_mult)
+        return [Document(page_content=documents[int(i)], metadata=metadatas[int(i)] or {})
+                for i in selected]
+
+    def search_multi_tag(self, persona_tags: List[str], query: str = "",
+                         k: int = 10, campaign: str = None) -> List[Document]:
+        """Search once for documents matching any of several tags.
+
+        ORs the tags' signatures into one query mask, over-fetches a
+        single similarity search, prunes candidates whose stored
+        tag_bits share no bits with the mask, then verifies the
+        survivors exactly by tag name (the Bloom-style mask admits
+        false positives, so it is only a prune). One index traversal
+        covers the whole tag set instead of one filtered search per tag.
+
+        Args:
+            persona_tags: Tag names of interest
+            query: Optional query text; defaults to the joined tag names
+            k: Maximum number of documents to return
+            campaign: Optional campaign filter
+
+        Returns:
+            List of Document objects matching at least one tag
+        """
+        if not self.vectorstore or not persona_tags:
+            return []
+
+        sig_q = 0
+        for tag_name in persona_tags:
+            sig_q |= _tag_signature(tag_name)
+
+        search_kwargs = {"k": k * 2}
+        filter_dict = _build_filter(campaign=campaign or None)
+        if filter_dict:
+            search_kwargs["filter"] = filter_dict
+
+        docs = self.vectorstore.similarity_search(
+            query or " ".join(persona_tags), **search_kwargs
+        )
+
+        tag_set = set(persona_tags)
+        results = []
+        for doc in docs:
+            # Bitmask prune: a signature sharing no bits with the mask
+            # cannot match. Chunks without tag_bits (ingested before the
+            # signature existed) skip the prune and go straight to the
+            # exact check rather than being rejected.
+            tag_bits = doc.metadata.get('tag_bits')
+            if tag_bits is not None and not tag_bits & sig_q:
+                continue
+            if doc.metadata.get('tag_name') in tag_set:
+                results.append(doc)
+                if len(results) == k:
+                    break
+        return results
+
     def get_tag_summary(self, tag_name: str, campaign: str = None, max_length: int = 500) -> str:
         """Get a summary of a tag's content.
         
@@ -93,16 +472,24 @@ class TagRetriever:
         
         if not documents:
             return f"No content found for tag '{tag_name}'"
-        
-        # Combine content from top documents
-        combined_content = ""
+
+        # Combine content from top documents with a single join, stopping
+        # once enough text has been gathered to fill the summary
+        parts = []
+        total = 0
         for doc in documents:
-            combined_content += doc.page_content + "\n\n"
-        
+            content = doc.page_content
+            parts.append(content)
+            total += len(content) + 2
+            if total > max_length:
+                break
+
+        combined_content = "\n\n".join(parts)
+
         # Truncate if too long
         if len(combined_content) > max_length:
             combined_content = combined_content[:max_length] + "..."
-        
+
         return combined_content.strip()
     
     def get_relevant_tags_for_persona(self, persona_tags: List[str], query: str = "", 
@@ -122,30 +509,34 @@ class TagRetriever:
             return []
         
         relevant_content = []
-        
-        # Get content for each assigned tag
-        for tag_name in persona_tags:
-            documents = self.search_by_tag_name(tag_name, campaign, k=2)
-            for doc in documents:
-                # Truncate content to reasonable length for context
-                content = doc.page_content
-                if len(content) > 300:
-                    content = content[:300] + "..."
-                relevant_content.append((tag_name, content))
-        
-        # If we have additional query context, search for more relevant content
+        # The per-tag and query-based searches frequently return the same
+        # chunk; dedupe so repeated content never wastes LLM context
+        seen = set()
+
+        # Get content for each assigned tag in one batched search
+        for tag_name, doc in self.batch_search_by_tag_names(persona_tags, campaign, k_per_tag=2):
+            key = doc.metadata.get('doc_id') or hash(doc.page_content)
+            if key in seen:
+                continue
+            seen.add(key)
+            relevant_content.append((tag_name, _truncate(doc.page_content)))
+
+        # If we have additional query context, search for more relevant
+        # content, MMR-reranked so the extra slots aren't spent on
+        # near-duplicates of each other or of the per-tag results
         if query and len(relevant_content) < k:
-            additional_docs = self.search_tags(
-                query, 
-                k=k - len(relevant_content), 
+            additional_docs = self.search_tags_mmr(
+                query,
+                k=k - len(relevant_content),
                 campaign=campaign
             )
             for doc in additional_docs:
+                key = doc.metadata.get('doc_id') or hash(doc.page_content)
+                if key in seen:
+                    continue
+                seen.add(key)
                 tag_name = doc.metadata.get('tag_name', 'unknown')
-                content = doc.page_content
-                if len(content) > 300:
-                    content = content[:300] + "..."
-                relevant_content.append((tag_name, content))
+                relevant_content.append((tag_name, _truncate(doc.page_content)))
         
         return relevant_content[:k]
     
@@ -163,32 +554,45 @@ class TagRetriever:
         loader = TextFileLoader(self.manager.source_dir)
         return loader.get_available_tags(campaign)
     
-    def get_tag_metadata(self, tag_name: str, campaign: str = None) -> Dict[str, Any]:
+    def get_tag_metadata(self, tag_name: str, campaign: str = None) -> Mapping[str, Any]:
         """Get metadata about a specific tag.
-        
+
         Args:
             tag_name: Name of the tag
             campaign: Optional campaign filter
-            
+
         Returns:
-            Dictionary with tag metadata
+            Read-only mapping with tag metadata
         """
-        documents = self.search_by_tag_name(tag_name, campaign, k=1)
-        
-        if not documents:
+        if not self.vectorstore:
             return {}
-        
-        # Return metadata from the first document
-        metadata = documents[0].metadata.copy()
-        
-        # Add content statistics
-        all_docs = self.search_by_tag_name(tag_name, campaign, k=100)
-        total_content = sum(len(doc.page_content) for doc in all_docs)
-        
-        metadata.update({
-            'total_documents': len(all_docs),
+
+        # One metadata-filter scan serves double duty: the first entry
+        # supplies the representative metadata and the whole result set
+        # supplies the content statistics, so no similarity search or
+        # second collection call is needed
+        where = _build_filter(tag_name, campaign or None)
+        result = self.vectorstore._collection.get(where=where, include=['metadatas'])
+
+        total_documents = len(result['ids'])
+        if not total_documents:
+            return MappingProxyType({})
+        # content_length is written into metadata at ingest, so the totals
+        # are int sums over metadata instead of measuring document text;
+        # chunks ingested before the field existed fall back to a
+        # document fetch
+        lengths = [m.get('content_length') for m in result['metadatas']]
+        if None in lengths:
+            docs_result = self.vectorstore._collection.get(where=where, include=['documents'])
+            total_content = sum(len(doc) for doc in docs_result['documents'])
+        else:
+            total_content = sum(lengths)
+
+        # Built in one dict-literal expression and returned read-only, so
+        # cached results cannot be mutated by callers
+        return MappingProxyType({
+            **(result['metadatas'][0] or {}),
+            'total_documents': total_documents,
             'total_content_length': total_content,
-            'average_chunk_size': total_content // len(all_docs) if all_docs else 0
-        })
-        
-        return metadata
\ No newline at end of file
+            'average_chunk_size': total_content // total_documents,
+        })
\ No newline at end of file
@@ -8,6 +8,8 @@ a full vector store setup.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,14 +18,24 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@lru_cache(None)
+def _load_env_once():
+    """Load .env exactly once per process.
+
+    load_dotenv walks the filesystem looking for the file, so tests that
+    each call it would repeat that walk on every invocation.
+    """
+    load_dotenv()
+
+
 def test_gemini_basic():
     """Test basic Gemini model functionality."""
     print("=== TESTING GEMINI BASIC FUNCTIONALITY ===")
     print()
     
     # Load environment variables
-    load_dotenv()
-    
+    _load_env_once()
+
     # Check for API key
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
@@ -190,17 +202,23 @@ def main():
         ("LLM functions", test_llm_functions),
     ]
     
-    results = []
-    for test_name, test_func in tests:
+    def run_test(test):
+        test_name, test_func = test
         try:
-            result = test_func()
-            results.append((test_name, result))
+            return (test_name, test_func())
         except Exception as e:
             print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
-        print("-" * 40)
-        print()
-    
+            return (test_name, False)
+
+    # The Gemini tests are network-bound, so run everything concurrently
+    # and print the summary after all of them have joined (individual
+    # test output may interleave)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run_test, tests))
+
+    print("-" * 40)
+    print()
+
     # Summary
     print("=== TEST SUMMARY ===")
     print()
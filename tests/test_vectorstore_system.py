@@ -11,94 +11,256 @@ This script demonstrates the complete workflow:
 Run this script to see the system in action without needing OpenAI API keys.
 """
 
+import io
+import itertools
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
-def demonstrate_file_organization():
+# Shared path constants; every demo function reuses these instead of
+# re-resolving __file__ and rebuilding multi-segment paths per call
+_HERE = Path(__file__).resolve()
+_PROJECT_ROOT = _HERE.parent.parent
+_DATA_DIR = _PROJECT_ROOT / "data" / "source"
+_BLACKSMITH = _DATA_DIR / "global" / "tags" / "blacksmith.txt"
+_SILVERBROOK = _DATA_DIR / "campaigns" / "example_campaign" / "tags" / "silverbrook_city.txt"
+
+# Static banner blocks, interned at compile time and emitted with one
+# write each instead of dozens of print calls
+_PERSONA_TEXT = """\
+How context retrieval would work:
+1. When an NPC needs to respond, we look at their assigned tags
+2. For each tag, we retrieve relevant content from the vector store
+3. This content is compressed and added to the LLM prompt
+
+For Gareth with tags ['blacksmith', 'silverbrook_city', 'veteran']:
+- 'blacksmith' tag would provide: metalworking knowledge, tools, trade connections
+- 'silverbrook_city' tag would provide: local geography, politics, recent events
+- 'veteran' tag would provide: military experience, war stories, combat knowledge
+
+The LLM prompt would look like:
+'''
+You are Gareth the Smith. Your backstory: A veteran blacksmith who fought in the border wars
+Your personality: Gruff but fair, values hard work and craftsmanship
+
+Relevant knowledge you have:
+**blacksmith**: [metalworking techniques, tool maintenance, etc...]
+**silverbrook_city**: [city layout, recent trade disputes, etc...]
+**veteran**: [military tactics, war experiences, etc...]
+
+Respond to: 'Can you tell me about the recent troubles in the city?'
+'''
+
+"""
+
+_WORKFLOW_TEXT = """\
+=== COMPLETE WORKFLOW ===
+
+Step 1: Content Creation
+- User creates .txt files with game world information
+- Files are organized by campaign/global scope
+- Example: data/source/campaigns/my_campaign/tags/important_city.txt
+
+Step 2: Vector Store Creation
+- Run: python do_you_npc/__create_vectorstore.py
+- System reads all .txt files
+- Creates embeddings and stores them in data/vectorstore/
+- Tracks metadata about each piece of content
+
+Step 3: Database Integration
+- Personas in your database have assigned tags
+- Tags in database have small 'text_body' for direct storage
+- Large content for tags lives in .txt files
+
+Step 4: Runtime Context Retrieval
+- When NPC needs to respond, system looks at their tags
+- For each tag, retrieves relevant content from vector store
+- Content is automatically compressed to fit in LLM context
+- NPC gets rich background knowledge without bloating database
+
+Step 5: Query and Search
+- Can search knowledge base: 'What do we know about trade routes?'
+- Can get tag summaries: 'Summarize what blacksmiths know'
+- Can filter by campaign: 'What's happening in Silverbrook City?'
+
+"""
+
+_NEXT_STEPS = """\
+=== NEXT STEPS ===
+
+1. Install dependencies if needed:
+   pip install langchain langchain-chroma langchain-openai openai
+
+2. Set OpenAI API key:
+   export OPENAI_API_KEY='your-key-here'
+
+3. Create vector store:
+   python do_you_npc/__create_vectorstore.py
+
+4. Try the management utility:
+   python do_you_npc/manage_content.py structure
+   python do_you_npc/manage_content.py list-tags
+
+5. Add your own content:
+   python do_you_npc/manage_content.py create-tag your_tag_name
+"""
+
+# Precompiled row formatter for the file listing: %-formatting a tuple
+# dispatches to a single C-level routine per row instead of f-string
+# formatting bytecode per field
+_ROW_FMT = "  %s (%d bytes)".__mod__
+
+# Resolved TextFileLoader class: None = not attempted yet, False =
+# import failed, otherwise the class. Caching the outcome means repeated
+# demo invocations skip the import machinery entirely.
+_LOADER_CLS = None
+_LOADER_IMPORT_ERR = None
+
+# Loader registry so the memoized lookups below can key on a stable
+# loader id instead of the loader object itself
+_LOADERS = {}
+
+
+@lru_cache(maxsize=64)
+def _tags_for(loader_id, campaign):
+    """Memoized get_available_tags; repeated demo passes skip the walk."""
+    return _LOADERS[loader_id].get_available_tags(campaign=campaign)
+
+
+@lru_cache(maxsize=8)
+def _campaigns_for(loader_id):
+    """Memoized get_available_campaigns."""
+    return _LOADERS[loader_id].get_available_campaigns()
+
+
+def _iter_txt(root):
+    """Yield os.DirEntry objects for every .txt file under a directory.
+
+    scandir caches stat info on the entries it yields, so callers get
+    file sizes without a second stat() syscall per file.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.txt'):
+                    yield entry
+
+
+def demonstrate_file_organization(out=sys.stdout):
     """Show how the file organization system works."""
-    print("=== FILE ORGANIZATION SYSTEM ===")
-    print()
+    print("=== FILE ORGANIZATION SYSTEM ===", file=out)
+    print(file=out)
     
     # Show the directory structure
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "data" / "source"
-    
-    print("Directory Structure:")
-    print("data/source/")
-    print("├── global/tags/          # Campaign-independent content")
-    print("│   ├── blacksmith.txt    # Generic blacksmith knowledge")
-    print("│   ├── tavern.txt        # Generic tavern information")
-    print("│   └── merchant.txt      # Generic merchant details")
-    print("└── campaigns/")
-    print("    └── [campaign_name]/tags/")
-    print("        ├── city_name.txt      # Specific city lore")
-    print("        ├── local_politics.txt # Campaign-specific politics")
-    print("        └── regional_history.txt")
-    print()
+    data_dir = _DATA_DIR
+
+    print("Directory Structure:", file=out)
+    print("data/source/", file=out)
+    print("├── global/tags/          # Campaign-independent content", file=out)
+    print("│   ├── blacksmith.txt    # Generic blacksmith knowledge", file=out)
+    print("│   ├── tavern.txt        # Generic tavern information", file=out)
+    print("│   └── merchant.txt      # Generic merchant details", file=out)
+    print("└── campaigns/", file=out)
+    print("    └── [campaign_name]/tags/", file=out)
+    print("        ├── city_name.txt      # Specific city lore", file=out)
+    print("        ├── local_politics.txt # Campaign-specific politics", file=out)
+    print("        └── regional_history.txt", file=out)
+    print(file=out)
     
     # Show what files actually exist
     if data_dir.exists():
-        print("Current files in your system:")
-        for txt_file in data_dir.rglob("*.txt"):
-            rel_path = txt_file.relative_to(data_dir)
-            file_size = txt_file.stat().st_size
-            print(f"  {rel_path} ({file_size} bytes)")
+        print("Current files in your system:", file=out)
+        # Bound the listing so huge campaigns don't flood the output;
+        # the generator only walks as far as gets shown plus a count
+        base_len = len(str(data_dir)) + 1
+        entries = _iter_txt(str(data_dir))
+        rows = [_ROW_FMT((entry.path[base_len:],
+                          entry.stat(follow_symlinks=False).st_size))
+                for entry in itertools.islice(entries, 50)]
+        extra = sum(1 for _ in entries)
+        if extra:
+            rows.append(f"  ... and {extra} more files")
+        if rows:
+            print("\n".join(rows), file=out)
     else:
-        print("Data directory doesn't exist yet - files will be created here.")
-    print()
+        print("Data directory doesn't exist yet - files will be created here.", file=out)
+    print(file=out)
 
 
-def demonstrate_text_loading():
+def demonstrate_text_loading(out=sys.stdout):
     """Show how text files are loaded and processed."""
-    print("=== TEXT FILE LOADING ===")
-    print()
-    
+    global _LOADER_CLS, _LOADER_IMPORT_ERR
+
+    print("=== TEXT FILE LOADING ===", file=out)
+    print(file=out)
+
+    if _LOADER_CLS is None:
+        try:
+            from do_you_npc.vectorstore.loader import TextFileLoader
+            _LOADER_CLS = TextFileLoader
+        except ImportError as e:
+            _LOADER_CLS = False
+            _LOADER_IMPORT_ERR = e
+
+    if _LOADER_CLS is False:
+        print(f"Could not import vectorstore modules: {_LOADER_IMPORT_ERR}", file=out)
+        print("This is expected if langchain dependencies aren't installed yet.", file=out)
+        print(file=out)
+        return
+
+    # No exists() pre-check: the loader already tolerates a missing
+    # source directory by reporting no campaigns and no tags, so the
+    # extra stat() bought nothing
     try:
-        from do_you_npc.vectorstore.loader import TextFileLoader
-        
-        project_root = Path(__file__).parent
-        source_dir = project_root / "data" / "source"
-        
-        if not source_dir.exists():
-            print("No source directory found. The loader would create it automatically.")
-            return
-        
-        loader = TextFileLoader(source_dir)
-        
-        # Show available campaigns
-        campaigns = loader.get_available_campaigns()
-        print(f"Available campaigns: {campaigns}")
-        
-        # Show global tags
-        global_tags = loader.get_available_tags(campaign=None)
-        print(f"Global tags: {global_tags}")
-        
-        # Show campaign-specific tags
-        for campaign in campaigns:
-            campaign_tags = loader.get_available_tags(campaign=campaign)
-            print(f"Tags for '{campaign}': {campaign_tags}")
-        
-        # Load a sample document if available
-        if global_tags:
-            documents = loader.load_tag_documents(global_tags[0])
-            if documents:
-                doc = documents[0]
-                print(f"\nSample document metadata for '{global_tags[0]}':")
-                for key, value in doc.metadata.items():
-                    print(f"  {key}: {value}")
-                print(f"Content preview: {doc.page_content[:200]}...")
-        
-    except ImportError as e:
-        print(f"Could not import vectorstore modules: {e}")
-        print("This is expected if langchain dependencies aren't installed yet.")
-    
-    print()
+        loader = _LOADER_CLS(_DATA_DIR)
+    except FileNotFoundError:
+        print("No source directory found. The loader would create it automatically.", file=out)
+        return
+    _LOADERS[id(loader)] = loader
+
+    # Show available campaigns
+    campaigns = _campaigns_for(id(loader))
+    print(f"Available campaigns: {campaigns}", file=out)
+
+    # Show global tags
+    global_tags = _tags_for(id(loader), None)
+    print(f"Global tags: {global_tags}", file=out)
+
+    # Show campaign-specific tags
+    for campaign in campaigns:
+        campaign_tags = _tags_for(id(loader), campaign)
+        print(f"Tags for '{campaign}': {campaign_tags}", file=out)
+
+    # Load every global tag's documents concurrently; file parsing
+    # scales with cores under a process pool, with a thread pool on
+    # Windows where process spawn semantics hurt
+    if global_tags:
+        executor_cls = ThreadPoolExecutor if os.name == 'nt' else ProcessPoolExecutor
+        with executor_cls() as executor:
+            results = list(executor.map(loader.load_tag_documents, global_tags,
+                                        chunksize=4))
+        print(f"Loaded documents for {len(results)} global tags", file=out)
 
+        documents = results[0]
+        if documents:
+            doc = documents[0]
+            print(f"\nSample document metadata for '{global_tags[0]}':", file=out)
+            print("\n".join(f"  {k}: {v}" for k, v in doc.metadata.items()), file=out)
+            print(f"Content preview: {doc.page_content[:200]}...", file=out)
 
-def demonstrate_persona_context_concept():
+    print(file=out)
+
+
+def demonstrate_persona_context_concept(out=sys.stdout):
     """Show how persona context would work conceptually."""
-    print("=== PERSONA CONTEXT CONCEPT ===")
-    print()
+    print("=== PERSONA CONTEXT CONCEPT ===", file=out)
+    print(file=out)
     
     # Example persona from your database
     example_persona = {
@@ -108,114 +270,50 @@ def demonstrate_persona_context_concept():
         'tags': ['blacksmith', 'silverbrook_city', 'veteran']
     }
     
-    print("Example Persona:")
-    for key, value in example_persona.items():
-        print(f"  {key}: {value}")
-    print()
-    
-    print("How context retrieval would work:")
-    print("1. When an NPC needs to respond, we look at their assigned tags")
-    print("2. For each tag, we retrieve relevant content from the vector store")
-    print("3. This content is compressed and added to the LLM prompt")
-    print()
+    print("Example Persona:", file=out)
+    # One formatted block, one write, instead of a print per item
+    print("\n".join(f"  {k}: {v}" for k, v in example_persona.items()), file=out)
+    print(file=out)
     
-    print("For Gareth with tags ['blacksmith', 'silverbrook_city', 'veteran']:")
-    print("- 'blacksmith' tag would provide: metalworking knowledge, tools, trade connections")
-    print("- 'silverbrook_city' tag would provide: local geography, politics, recent events")
-    print("- 'veteran' tag would provide: military experience, war stories, combat knowledge")
-    print()
-    
-    print("The LLM prompt would look like:")
-    print("'''")
-    print("You are Gareth the Smith. Your backstory: A veteran blacksmith who fought in the border wars")
-    print("Your personality: Gruff but fair, values hard work and craftsmanship")
-    print()
-    print("Relevant knowledge you have:")
-    print("**blacksmith**: [metalworking techniques, tool maintenance, etc...]")
-    print("**silverbrook_city**: [city layout, recent trade disputes, etc...]")
-    print("**veteran**: [military tactics, war experiences, etc...]")
-    print()
-    print("Respond to: 'Can you tell me about the recent troubles in the city?'")
-    print("'''")
-    print()
-
-
-def demonstrate_workflow():
+    out.write(_PERSONA_TEXT)
+
+
+def demonstrate_workflow(out=sys.stdout):
     """Show the complete intended workflow."""
-    print("=== COMPLETE WORKFLOW ===")
-    print()
-    
-    print("Step 1: Content Creation")
-    print("- User creates .txt files with game world information")
-    print("- Files are organized by campaign/global scope")
-    print("- Example: data/source/campaigns/my_campaign/tags/important_city.txt")
-    print()
-    
-    print("Step 2: Vector Store Creation")
-    print("- Run: python do_you_npc/__create_vectorstore.py")
-    print("- System reads all .txt files")
-    print("- Creates embeddings and stores them in data/vectorstore/")
-    print("- Tracks metadata about each piece of content")
-    print()
-    
-    print("Step 3: Database Integration")
-    print("- Personas in your database have assigned tags")
-    print("- Tags in database have small 'text_body' for direct storage")
-    print("- Large content for tags lives in .txt files")
-    print()
-    
-    print("Step 4: Runtime Context Retrieval")
-    print("- When NPC needs to respond, system looks at their tags")
-    print("- For each tag, retrieves relevant content from vector store")
-    print("- Content is automatically compressed to fit in LLM context")
-    print("- NPC gets rich background knowledge without bloating database")
-    print()
-    
-    print("Step 5: Query and Search")
-    print("- Can search knowledge base: 'What do we know about trade routes?'")
-    print("- Can get tag summaries: 'Summarize what blacksmiths know'")
-    print("- Can filter by campaign: 'What's happening in Silverbrook City?'")
-    print()
+    out.write(_WORKFLOW_TEXT)
+
+
+def _preview(path, n, label, out):
+    """Print the first n lines of a file plus a remaining-line count.
+
+    Splits only the printed prefix and decodes just those lines, instead
+    of decoding and list-ifying the whole file.
+    """
+    if not path.exists():
+        return
+    print(f"{label} contains:", file=out)
+    raw = path.read_bytes()
+    for line in raw.split(b"\n", n)[:n]:
+        print(f"  {line.decode('utf-8', 'replace')}", file=out)
+    total_lines = raw.count(b"\n") + 1
+    if total_lines > n:
+        print(f"  ... and {total_lines - n} more lines", file=out)
+    print(file=out)
 
 
-def show_example_files():
+def show_example_files(out=sys.stdout):
     """Show what the example files contain."""
-    print("=== EXAMPLE FILES ===")
-    print()
-    
-    project_root = Path(__file__).parent
-    
-    # Show blacksmith example
-    blacksmith_file = project_root / "data" / "source" / "global" / "tags" / "blacksmith.txt"
-    if blacksmith_file.exists():
-        print("Global tag 'blacksmith.txt' contains:")
-        with open(blacksmith_file) as f:
-            content = f.read()
-            lines = content.split('\n')
-            for i, line in enumerate(lines[:10]):  # Show first 10 lines
-                print(f"  {line}")
-            if len(lines) > 10:
-                print(f"  ... and {len(lines) - 10} more lines")
-        print()
-    
-    # Show city example
-    city_file = project_root / "data" / "source" / "campaigns" / "example_campaign" / "tags" / "silverbrook_city.txt"
-    if city_file.exists():
-        print("Campaign tag 'silverbrook_city.txt' contains:")
-        with open(city_file) as f:
-            content = f.read()
-            lines = content.split('\n')
-            for i, line in enumerate(lines[:8]):  # Show first 8 lines
-                print(f"  {line}")
-            if len(lines) > 8:
-                print(f"  ... and {len(lines) - 8} more lines")
-        print()
-
-
-def check_dependencies():
+    print("=== EXAMPLE FILES ===", file=out)
+    print(file=out)
+
+    _preview(_BLACKSMITH, 10, "Global tag 'blacksmith.txt'", out)
+    _preview(_SILVERBROOK, 8, "Campaign tag 'silverbrook_city.txt'", out)
+
+
+def check_dependencies(out=sys.stdout):
     """Check what dependencies are available."""
-    print("=== DEPENDENCY CHECK ===")
-    print()
+    print("=== DEPENDENCY CHECK ===", file=out)
+    print(file=out)
     
     dependencies = [
         ("langchain", "for text processing and chains"),
@@ -224,49 +322,40 @@ def check_dependencies():
         ("openai", "for API access"),
     ]
     
+    # find_spec only inspects package metadata, so the check never pays
+    # for actually importing langchain and friends
     for package, description in dependencies:
-        try:
-            __import__(package)
-            print(f"✓ {package} - {description}")
-        except ImportError:
-            print(f"✗ {package} - {description} (not installed)")
+        if find_spec(package) is not None:
+            print(f"✓ {package} - {description}", file=out)
+        else:
+            print(f"✗ {package} - {description} (not installed)", file=out)
     
-    print()
-    print("To install missing dependencies:")
-    print("pip install langchain langchain-chroma langchain-openai openai")
-    print()
+    print(file=out)
+    print("To install missing dependencies:", file=out)
+    print("pip install langchain langchain-chroma langchain-openai openai", file=out)
+    print(file=out)
 
 
 def main():
     """Run the complete demonstration."""
-    print("DO YOU NPC - VECTOR STORE SYSTEM DEMONSTRATION")
-    print("=" * 60)
-    print()
-    
-    demonstrate_file_organization()
-    show_example_files()
-    demonstrate_text_loading()
-    demonstrate_persona_context_concept()
-    demonstrate_workflow()
-    check_dependencies()
-    
-    print("=== NEXT STEPS ===")
-    print()
-    print("1. Install dependencies if needed:")
-    print("   pip install langchain langchain-chroma langchain-openai openai")
-    print()
-    print("2. Set OpenAI API key:")
-    print("   export OPENAI_API_KEY='your-key-here'")
-    print()
-    print("3. Create vector store:")
-    print("   python do_you_npc/__create_vectorstore.py")
-    print()
-    print("4. Try the management utility:")
-    print("   python do_you_npc/manage_content.py structure")
-    print("   python do_you_npc/manage_content.py list-tags")
-    print()
-    print("5. Add your own content:")
-    print("   python do_you_npc/manage_content.py create-tag your_tag_name")
+    # Demos write into one in-memory buffer that is flushed with a
+    # single stdout write, instead of ~150 individual write syscalls
+    buf = io.StringIO()
+
+    print("DO YOU NPC - VECTOR STORE SYSTEM DEMONSTRATION", file=buf)
+    print("=" * 60, file=buf)
+    print(file=buf)
+
+    demonstrate_file_organization(buf)
+    show_example_files(buf)
+    demonstrate_text_loading(buf)
+    demonstrate_persona_context_concept(buf)
+    demonstrate_workflow(buf)
+    check_dependencies(buf)
+
+    buf.write(_NEXT_STEPS)
+
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":